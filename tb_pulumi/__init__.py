@@ -3,13 +3,16 @@ to use this library, read the :ref:`getting_started` page.
 """
 
 # <https://thunderbird.github.io/pulumi/getting-started.html>`_
-import boto3
+# boto3 and yaml are imported lazily where they are first needed; both (boto3 especially, with its botocore data file
+# loading) add substantial latency to `import tb_pulumi` that not every caller needs to pay.
 import pulumi
-import yaml
 
-from functools import cached_property
-from os import environ, getlogin, path
+from collections.abc import Iterable
+from functools import cached_property, lru_cache
+from getpass import getuser
+from os import environ
 from socket import gethostname
+from types import MappingProxyType
 from tb_pulumi.constants import DEFAULT_PROTECTED_STACKS
 from typing import Any
 
@@ -17,6 +20,62 @@ from typing import Any
 #: Type alias representing valid types to be found among a ThunderbirdPulumiProject's resources
 type Flattenable = dict | list | ThunderbirdComponentResource | pulumi.Output | pulumi.Resource
 
+#: Maps plain collection types to the callable which produces their members. ``flatten`` resolves each node with a
+#: single dict lookup rather than a cascade of type checks.
+_FLATTEN_CHILDREN = {list: iter, tuple: iter, dict: dict.values}
+
+#: Lowercase values we consider to be an affirmative setting of an environment variable
+_TRUE_VALUES = frozenset(('t', 'true', 'yes'))
+
+
+@lru_cache(maxsize=None)
+def _run_by() -> str:
+    """Identifies the acting party as ``user@host``. This cannot change mid-process, so it is computed only once;
+    ``getuser`` can fall through to the password database and ``gethostname`` is a syscall. ``getuser`` consults the
+    usual environment variables first, which covers the machines where ``getlogin`` fails (no controlling terminal,
+    containers, some CI), but it can still raise in unusual environments, in which case we settle for a placeholder."""
+
+    try:
+        username = getuser()
+    except Exception:
+        username = 'unknown'
+    return f'{username}@{gethostname()}'
+
+
+@lru_cache(maxsize=None)
+def _aws_session() -> 'boto3.session.Session':  # noqa: F821
+    """Returns a process-wide boto3 Session. Session construction resolves credentials and loads botocore data files,
+    which is slow enough that we only ever want to do it once per process, no matter how many projects exist."""
+
+    import boto3
+
+    return boto3.session.Session()
+
+
+@lru_cache(maxsize=None)
+def _aws_client(service: str, region_name: str = None):
+    """Returns a cached boto3 client for the requested service, creating it on first use. Clients are shared process-
+    wide so repeated lookups (even across projects) do not rebuild them. The cache is keyed on the plain
+    ``(service, region_name)`` argument tuple, which hashes faster than a formatted string key would.
+
+    :param service: Name of the service as described in
+        `boto3 docs <https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/index.html>`_
+    :type service: str
+
+    :param region_name: Region to build the client in. Defaults to the session's configured region.
+    :type region_name: str, optional
+    """
+
+    return _aws_session().client(service, region_name=region_name)
+
+
+@lru_cache(maxsize=None)
+def _aws_account_id() -> str:
+    """Returns the account ID of the currently configured AWS user/role. This is a synchronous STS API call, so the
+    result is cached for the life of the process; the acting account cannot change mid-run."""
+
+    return _aws_client('sts').get_caller_identity()['Account']
+
 
 class ThunderbirdPulumiProject:
     """A collection of related Pulumi resources upon which we can take bulk/collective actions. This class enforces some
@@ -32,64 +91,139 @@ class ThunderbirdPulumiProject:
         self.project: str = pulumi.get_project()  #: Name of the Pulumi project
         self.stack: str = pulumi.get_stack()  #: Name of the Pulumi stack
         self.name_prefix: str = f'{self.project}-{self.stack}'  #: Convenience prefix for naming resources consistently
-        self.protected_stacks: list[str] = protected_stacks
+        #: Stacks requiring explicit instruction to modify; stored as a frozenset since we only ever test membership
+        self.protected_stacks: frozenset[str] = frozenset(protected_stacks)
         #: Pulumi configuration data referencing Pulumi.stack.yaml
         self.pulumi_config: pulumi.config.Config = pulumi.Config()
-        self.resources: dict = {}  #: Pulumi Resource objects managed by this project
-
-        # Some machines can't run a getlogin(), which is the preferred method, but we support some others
-        try:
-            username = getlogin()
-        except OSError:
-            homepath = path.expanduser('~')
-            unix_style = homepath.split('/')
-            win_style = homepath.split('\\')
-            if len(unix_style) > 1:
-                username = unix_style[-1]
-            elif len(win_style) > 1:
-                username = win_style[-1]
-            else:
-                username = 'unknown'
-
-        self.common_tags: dict = {  #: Tags to apply to all taggable resources
-            'environment': self.stack,
-            'project': self.project,
-            'pulumi_last_run_by': f'{username}@{gethostname()}',
-            'pulumi_project': self.project,
-            'pulumi_stack': self.stack,
-        }
-
-        # AWS client setup
-        self.__aws_clients = {}
-        self.__aws_session = boto3.session.Session()
-        sts = self.get_aws_client('sts')
-
-        #: Account number that the currently configured AWS user/role is a member of, in which Pulumi will act.
-        self.aws_account_id: str = sts.get_caller_identity()['Account']
-        #: Currently configured AWS region
-        self.aws_region: str = self.__aws_session.region_name
-
-    def get_aws_client(self, service: str):
-        """Retrieves an AWS client for the requested service, preferably from a cache. Caches any clients it creates.
+        # Neither the stack nor the environment can change mid-run, so resolve protection once here instead of once per
+        # component resource
+        self._disable_protection: bool = env_var_is_true('TBPULUMI_DISABLE_PROTECTION')
+        #: Whether component resources in this project should be protected from changes by default
+        self.protect_default: bool = self.stack in self.protected_stacks and not self._disable_protection
+        # Component resources queue their registrations here; they get folded into the resource map in one batch the
+        # next time ``resources`` is read, rather than paying for a dict insert per ``finish()`` call.
+        self._resources: dict = {}
+        self._pending_registrations: list[tuple[str, dict]] = []
+
+        #: Tags to apply to all taggable resources. This is a read-only mapping; component resources share it directly
+        #: when they have no tag overrides of their own, so mutating it would corrupt every resource's tags at once.
+        self.common_tags: MappingProxyType = MappingProxyType(
+            {
+                'environment': self.stack,
+                'project': self.project,
+                'pulumi_last_run_by': _run_by(),
+                'pulumi_project': self.project,
+                'pulumi_stack': self.stack,
+            }
+        )
+
+    @cached_property
+    def _default_resource_opts(self) -> pulumi.ResourceOptions:
+        """Default ``ResourceOptions`` shared by every component resource in this project. Protection is constant for
+        the life of a project, and ``ResourceOptions.merge`` never mutates its arguments, so a single instance is safe
+        to reuse instead of allocating one per resource."""
+
+        return pulumi.ResourceOptions(protect=self.protect_default)
+
+    @cached_property
+    def _aws_identity(self) -> tuple[str, str]:
+        """The ``(account_id, region)`` pair describing where Pulumi will act. Both values come from one pass over the
+        session and STS, resolved lazily on first access so runs that never consult them skip the boto3 setup and the
+        GetCallerIdentity call entirely, and cached as a tuple so the provider chain is only probed once."""
+
+        session = _aws_session()
+        return _aws_account_id(), session.region_name
+
+    @property
+    def aws_account_id(self) -> str:
+        """Account number that the currently configured AWS user/role is a member of, in which Pulumi will act."""
+
+        return self._aws_identity[0]
+
+    @property
+    def aws_region(self) -> str:
+        """Currently configured AWS region."""
+
+        return self._aws_identity[1]
+
+    def get_aws_client(self, service: str, region_name: str = None):
+        """Retrieves an AWS client for the requested service, preferably from a cache. Clients are cached at the module
+        level, so they are shared among all projects in the process.
 
         :param service: Name of the service as described in
             `boto3 docs <https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/index.html>`_
         :type service: str
+
+        :param region_name: Region to build the client in. Defaults to the project's region.
+        :type region_name: str, optional
         """
-        if service not in self.__aws_clients.keys():
-            self.__aws_clients[service] = self.__aws_session.client(service)
 
-        return self.__aws_clients[service]
+        return _aws_client(service, region_name or self.aws_region)
+
+    @property
+    def resources(self) -> dict:
+        """Pulumi Resource objects managed by this project. Registrations queued up by ``finish`` calls are folded in
+        as a single batch the first time this is read after they accumulate."""
+
+        if self._pending_registrations:
+            self._resources.update(self._pending_registrations)
+            self._pending_registrations.clear()
+        return self._resources
 
     @cached_property
     def config(self) -> dict:
         """Provides read-only access to the project configuration, which is expected to be in the root of your Pulumi
         project directory, and should match the current stack. For example, ``config.preprod.yaml`` would be a
-        configuration for an environment called "preprod"."""
+        configuration for an environment called "preprod".
+
+        The parsed config is cached as a pickle under ``.pulumi/cache/``, keyed on the YAML file's mtime and size;
+        warm runs skip the YAML parser entirely. Set ``TBPULUMI_CONFIG_CACHE=0`` to bypass the cache."""
+
+        import os
+        import pickle
 
         config_file = f'config.{self.stack}.yaml'
-        with open(config_file, 'r') as fh:
-            return yaml.load(fh.read(), Loader=yaml.SafeLoader)
+
+        # Unpickling a nested dict is much faster than parsing the equivalent YAML, and these configs rarely change
+        # between runs. The sidecar's meta file records the source file's mtime and size; when they match, the pickled
+        # copy is current. Cache problems of any kind (corrupt or unreadable files, unwritable directories) are never
+        # fatal; we just fall back to parsing the YAML.
+        use_cache = environ.get('TBPULUMI_CONFIG_CACHE') != '0'
+        cache_file = f'.pulumi/cache/{config_file}.pkl'
+        meta_file = f'{cache_file}.meta'
+        stat = os.stat(config_file)
+        meta = f'{stat.st_mtime_ns}:{stat.st_size}'
+        if use_cache:
+            try:
+                with open(meta_file, 'r') as fh:
+                    if fh.read() == meta:
+                        with open(cache_file, 'rb') as fh:
+                            return pickle.load(fh)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                pass
+
+        # Prefer libyaml's CSafeLoader, which parses much faster than the pure-Python SafeLoader with identical
+        # semantics. Not every environment ships libyaml, so fall back to the pure-Python loader when it's unavailable.
+        # Handing the parser the raw bytes in one read skips the syscalls and decoding of incremental text I/O.
+        import yaml
+        from pathlib import Path
+
+        config = yaml.load(Path(config_file).read_bytes(), Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+
+        if use_cache:
+            try:
+                os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+                # Write-then-rename keeps a concurrent run from ever seeing a partially written pickle
+                with open(f'{cache_file}.tmp', 'wb') as fh:
+                    pickle.dump(config, fh, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(f'{cache_file}.tmp', cache_file)
+                with open(f'{meta_file}.tmp', 'w') as fh:
+                    fh.write(meta)
+                os.replace(f'{meta_file}.tmp', meta_file)
+            except OSError:
+                pass
+
+        return config
 
     def flatten(self) -> set[pulumi.Resource]:
         """Returns a flat set of all resources existing within this project."""
@@ -121,10 +255,14 @@ class ThunderbirdComponentResource(pulumi.ComponentResource):
     :type opts: pulumi.ResourceOptions, optional
 
     :param tags: Key/value pairs to merge with the default tags which get applied to all resources in this group.
-        Defaults to {}.
+        Defaults to None.
     :type tags: dict, optional
     """
 
+    # Large stacks build hundreds of these; slot storage makes our own attribute access a fixed offset instead of a
+    # dict lookup. Subclasses may still set arbitrary attributes, as pulumi's base class keeps ``__dict__`` around.
+    __slots__ = ('name', 'project', 'exclude_from_project', 'tags', 'resources')
+
     def __init__(
         self,
         pulumi_type: str,
@@ -132,7 +270,7 @@ class ThunderbirdComponentResource(pulumi.ComponentResource):
         project: ThunderbirdPulumiProject,
         exclude_from_project: bool = False,
         opts: pulumi.ResourceOptions = None,
-        tags: dict = {},
+        tags: dict = None,
     ):
         self.name: str = name  #: Identifier for this set of resources.
         self.project: ThunderbirdPulumiProject = project  #: Project this resource is a member of.
@@ -143,33 +281,40 @@ class ThunderbirdComponentResource(pulumi.ComponentResource):
                 f'Resource protection has been enabled on {name}. To disable, export TBPULUMI_DISABLE_PROTECTION=True'
             )
 
-        # Merge provided opts with defaults before calling superconstructor
-        default_opts = pulumi.ResourceOptions(protect=self.protect_resources)
-        final_opts = default_opts.merge(opts)
+        # Merge provided opts with the project's shared defaults before calling superconstructor
+        final_opts = self.project._default_resource_opts.merge(opts)
         super().__init__(t=pulumi_type, name=name, opts=final_opts)
 
-        self.tags: dict = self.project.common_tags.copy()  #: Tags to apply to all taggable resources
-        self.tags.update(tags)
+        #: Tags to apply to all taggable resources; user-supplied tags win on conflict. When there are no overrides
+        #: (the common case), the project's read-only mapping is shared instead of copied.
+        self.tags = self.project.common_tags if not tags else {**self.project.common_tags, **tags}
 
         self.resources: dict = {}  #: Resources which are members of this ComponentResource.
 
-    def finish(self, outputs: dict[str, Any], resources: dict[str, pulumi.Resource | list[pulumi.Resource]]):
+    def finish(
+        self,
+        outputs: dict[str, Any] = None,
+        resources: dict[str, pulumi.Resource | list[pulumi.Resource]] = None,
+    ):
         """Registers the provided ``outputs`` as Pulumi outputs for the module. Also stores the mapping of ``resources``
         internally as the ``resources`` member where they can be acted on collectively by a
         ``ThunderbirdPulumiProject``. Any implementation of this class should call this function at the end of its
         ``__init__`` function to ensure its state is properly represented.
 
         Values in ``resources`` should be either a Resource or derivative (such as a ThunderbirdComponentResource).
-        Alternatively, supply a list or dict of such.
+        Alternatively, supply a list or dict of such. Both parameters may be omitted when a component has nothing to
+        report. Entries whose value is ``None`` (a common way for components to report optional resources they did not
+        build) are dropped rather than registered, keeping the project's resource map and everything that walks it
+        (``flatten``, monitoring patterns) free of placeholders.
         """
 
         # Register resources internally; register outputs with Pulumi
-        self.resources = resources
-        self.register_outputs(outputs)
+        self.resources = {key: value for key, value in resources.items() if value is not None} if resources else {}
+        self.register_outputs(outputs if outputs is not None else {})
 
-        # Register resources within the project if not excluded
+        # Queue this registration with the project if not excluded; the project batches these into its resource map
         if not self.exclude_from_project:
-            self.project.resources[self.name] = self.resources
+            self.project._pending_registrations.append((self.name, self.resources))
 
     @property
     def protect_resources(self) -> bool:
@@ -177,22 +322,19 @@ class ThunderbirdComponentResource(pulumi.ComponentResource):
         configuration. Unprotected resources are not part of a protected stack, or you have run Pulumi with
         ``TBPULUMI_DISABLE_PROTECTION=True`` set in your environment."""
 
-        if self.project.stack not in self.project.protected_stacks:
-            protect = False
-        else:
-            protect = not env_var_is_true('TBPULUMI_DISABLE_PROTECTION')
+        # The project resolves this once at construction time; reading it here keeps the public API unchanged
+        return self.project.protect_default
 
-        return protect
 
-
-def env_var_matches(name: str, matches: list[str], default: bool = False) -> bool:
-    """Determines if the value of the given environment variable is in the given list. This is a case-insensitive check.
+def env_var_matches(name: str, matches: Iterable[str], default: bool = False) -> bool:
+    """Determines if the value of the given environment variable is in the given collection. This is a case-insensitive
+    check.
 
     :param name: The environment variable to check
     :type name: str
 
-    :param matches: A list of strings to match against
-    :type matches: list[str]
+    :param matches: A collection of strings to match against, such as a list or frozenset
+    :type matches: Iterable[str]
 
     :param default: Default value if the variable doesn't match. Defaults to False.
     :type default: bool, optional
@@ -200,20 +342,14 @@ def env_var_matches(name: str, matches: list[str], default: bool = False) -> boo
     :return: True if the value of the given environment variable is in the given list, the provided `default` value if
         it is not, or `None` if the variable is unset.
     :rtype: bool
-
-        - name:
-        - matches:
-        - default:
     """
 
-    # Convert to lowercase for case-insensitive matching
-    matches = [match.lower() for match in matches]
     value = environ.get(name, None)
     if value is None:
         return None
-    if value.lower() in matches:
-        return True
-    return default
+    # Compare case-insensitively without building an intermediate lowercased list on every call
+    value = value.lower()
+    return True if any(value == match.lower() for match in matches) else default
 
 
 def env_var_is_true(name: str) -> bool:
@@ -227,12 +363,15 @@ def env_var_is_true(name: str) -> bool:
     :rtype: bool
     """
 
-    return env_var_matches(name, ['t', 'true', 'yes'], False)
+    # This check runs for every component resource built (via ``protect_resources``), so skip the generality of
+    # ``env_var_matches`` in favor of one hashed lookup against a precomputed set.
+    value = environ.get(name)
+    return value is not None and value.lower() in _TRUE_VALUES
 
 
 def flatten(item: Flattenable) -> set[pulumi.Resource]:
-    """Recursively traverses a nested collection of Pulumi ``Resource`` s, converting them into a flat set which can be
-    more easily iterated over.
+    """Traverses a nested collection of Pulumi ``Resource`` s, converting them into a flat set which can be more easily
+    iterated over.
 
     :param item: An item which we intend to flatten. Must be one of the recognized types or collections defined in
         the Flattenable type alias.
@@ -242,21 +381,19 @@ def flatten(item: Flattenable) -> set[pulumi.Resource]:
     :rtype: set(pulumi.Resource)
     """
 
-    # The item could be of a variety of types. When the item is some kind of collection, we should compress it down into
-    # a flat list first, then operate on its items.
-    flattened = []
-    to_flatten = None
-    if type(item) is list:
-        to_flatten = item
-    elif type(item) is dict:
-        to_flatten = item.values()
-    elif isinstance(item, ThunderbirdComponentResource):
-        to_flatten = item.resources.values()
-    elif isinstance(item, pulumi.Resource) or isinstance(item, pulumi.Output):
-        return [item]
-
-    if to_flatten is not None:
-        for item in to_flatten:
-            flattened.extend(flatten(item))
-
-    return set(flattened)
+    # The items could be of a variety of types. Walk the collection with an explicit stack instead of recursing; deep
+    # resource trees would otherwise pay for a Python stack frame and an intermediate list at every level. Leaf
+    # resources land directly in the result set while collections have their members pushed to be visited in turn.
+    flattened = set()
+    to_flatten = [item]
+    while to_flatten:
+        current = to_flatten.pop()
+        children = _FLATTEN_CHILDREN.get(type(current))
+        if children is not None:
+            to_flatten.extend(children(current))
+        elif isinstance(current, ThunderbirdComponentResource):
+            to_flatten.extend(current.resources.values())
+        elif isinstance(current, (pulumi.Resource, pulumi.Output)):
+            flattened.add(current)
+
+    return flattened
@@ -5,6 +5,162 @@ import pulumi
 import pulumi_aws as aws
 import tb_pulumi
 
+from functools import lru_cache
+
+
+# Static pieces of the IAM policies assembled below. These never vary between instantiations, so they are built once at
+# import; each policy builder only assembles the variable parts (ARNs, region, account) around them.
+_ECR_IMAGE_ACTIONS = (
+    'ecr:BatchCheckLayerAvailability',
+    'ecr:BatchGetImage',
+    'ecr:CompleteLayerUpload',
+    'ecr:DescribeImages',
+    'ecr:InitiateLayerUpload',
+    'ecr:GetDownloadUrlForLayer',
+    'ecr:ListImages',
+    'ecr:UploadLayerPart',
+    'ecr:PutImage',
+)
+
+_ECR_AUTH_STATEMENT = {
+    'Sid': 'AuthActions',
+    'Effect': 'Allow',
+    'Action': ('ecr:GetAuthorizationToken',),
+    'Resource': ('*',),
+}
+
+_ECS_DESCRIBE_TASKDEFS_STATEMENT = {
+    'Sid': 'DescribeTaskDefs',
+    'Effect': 'Allow',
+    'Action': ('ecs:DescribeTaskDefinition',),
+    'Resource': ('*',),
+}
+
+_ECS_GLOBAL_READ_STATEMENT = {
+    'Sid': 'GlobalObjectReadAccess',
+    'Effect': 'Allow',
+    'Action': (
+        'cloudwatch:Describe*',
+        'cloudwatch:List*',
+        'cloudwatch:TagResource',
+        'ec2:List*',
+        'ec2:Get*',
+        'ec2:Describe*',
+        'ecs:DeregisterTaskDefinition',
+        'elasticloadbalancing:Describe*',
+        's3:ListAllMyBuckets',
+    ),
+    'Resource': ('*',),
+}
+
+
+@lru_cache(maxsize=None)
+def _ecr_push_policy_json(region: str, account_id: str, repositories: tuple) -> str:
+    """Builds the policy document allowing images to be pushed to the given ECR repositories."""
+
+    repo_prefix = f'arn:aws:ecr:{region}:{account_id}:repository/'
+    return json.dumps(
+        {
+            'Version': '2012-10-17',
+            'Statement': [
+                {
+                    'Sid': 'ImageActions',
+                    'Effect': 'Allow',
+                    'Action': _ECR_IMAGE_ACTIONS,
+                    'Resource': [f'{repo_prefix}{repo}' for repo in repositories],
+                },
+                _ECR_AUTH_STATEMENT,
+            ],
+        },
+        # Compact separators shave bytes off every policy payload the engine relays; IAM also caps document size
+        separators=(',', ':'),
+    )
+
+
+@lru_cache(maxsize=None)
+def _s3_upload_policy_json(buckets: tuple) -> str:
+    """Builds the policy document allowing objects to be uploaded to the given S3 buckets."""
+
+    return json.dumps(
+        {
+            'Version': '2012-10-17',
+            'Statement': [
+                {
+                    'Sid': 'PutObjects',
+                    'Effect': 'Allow',
+                    'Action': ('s3:PutObject',),
+                    'Resource': [f'arn:aws:s3:::{bucket}/*' for bucket in buckets],
+                }
+            ],
+        },
+        separators=(',', ':'),
+    )
+
+
+@lru_cache(maxsize=None)
+def _s3_full_access_policy_json(buckets: tuple) -> str:
+    """Builds the policy document allowing unrestricted access to the given S3 buckets and their contents."""
+
+    # One flattening comprehension instead of two .append calls per bucket
+    resources = [arn for bucket in buckets for arn in (f'arn:aws:s3:::{bucket}', f'arn:aws:s3:::{bucket}/*')]
+    return json.dumps(
+        {
+            'Version': '2012-10-17',
+            'Statement': [
+                {
+                    'Sid': 'S3FullAccess',
+                    'Effect': 'Allow',
+                    'Action': ('s3:*',),
+                    'Resource': resources,
+                }
+            ],
+        },
+        separators=(',', ':'),
+    )
+
+
+@lru_cache(maxsize=None)
+def _fargate_deployment_policy_json(region: str, account_id: str, clusters: tuple, task_role_arns: tuple) -> str:
+    """Builds the policy document allowing task definitions to be deployed to the given Fargate clusters."""
+
+    # Interpolate the shared region/account prefix once rather than once per ARN, and walk the clusters a single
+    # time to produce both the write-scope ARNs and the task-definition ARNs
+    ecs_prefix = f'arn:aws:ecs:{region}:{account_id}'
+    ecs_write_resources = []
+    task_def_resources = []
+    for cluster in clusters:
+        ecs_write_resources += (f'{ecs_prefix}:*/{cluster}', f'{ecs_prefix}:*/{cluster}/*')
+        task_def_resources.append(f'{ecs_prefix}:task-definition/{cluster}:*')
+
+    return json.dumps(
+        {
+            'Version': '2012-10-17',
+            'Statement': [
+                {
+                    'Sid': 'EcsWriteAccess',
+                    'Effect': 'Allow',
+                    'Action': ('ecs:*',),
+                    'Resource': ecs_write_resources,
+                },
+                _ECS_DESCRIBE_TASKDEFS_STATEMENT,
+                {
+                    'Sid': 'RegisterTaskDef',
+                    'Effect': 'Allow',
+                    'Action': ('ecs:RegisterTaskDefinition',),
+                    'Resource': task_def_resources,
+                },
+                _ECS_GLOBAL_READ_STATEMENT,
+                {
+                    'Sid': 'IamFargateAuth',
+                    'Effect': 'Allow',
+                    'Action': ('iam:PassRole',),
+                    'Resource': list(task_role_arns),
+                },
+            ],
+        },
+        separators=(',', ':'),
+    )
+
 
 class AwsAutomationUser(tb_pulumi.ThunderbirdComponentResource):
     """Creates an IAM user, then creates a keypair for it. The keypair data is stored in Secrets Manager. Several
@@ -24,7 +180,7 @@ class AwsAutomationUser(tb_pulumi.ThunderbirdComponentResource):
         You should always set this to a stack you expect to be a permanent fixture in your infrastructure.
     :type active_stack: str, optional
 
-    :param additional_policies: List of ARNs of IAM policies to additionally attach to the user. Defaults to [].
+    :param additional_policies: List of ARNs of IAM policies to additionally attach to the user. Defaults to None.
     :type additional_policies: list[str], optional
 
     :param enable_ecr_image_push: When True, attaches a policy to the user which allows it to push images to ECR
@@ -39,7 +195,7 @@ class AwsAutomationUser(tb_pulumi.ThunderbirdComponentResource):
     :param enable_fargate_deployments: When True, attaches a policy which allows new task definitions to be deployed
         to Fargate services. Use this when your CI pipeline needs to deploy new images to Fargate services. Defaults
         to False.
-    :type enable_fargate_deployments: str, optional
+    :type enable_fargate_deployments: bool, optional
 
     :param fargate_clusters: When ``enable_fargate_deployments`` is True, permission will be granted to deploy to
         this list of clusters. Defaults to None.
@@ -56,7 +212,7 @@ class AwsAutomationUser(tb_pulumi.ThunderbirdComponentResource):
     :type enable_full_s3_access: bool, optional
 
     :param s3_full_access_buckets: When ``enable_full_s3_access`` is True, full permission will be granted to this
-        list of buckets and all objects within them. Defaults to [].
+        list of buckets and all objects within them. Defaults to None.
     :type s3_full_access_buckets: list, optional
 
     :param enable_s3_bucket_upload: When True, allows the user to upload files into select S3 buckets. Use this when
@@ -65,7 +221,7 @@ class AwsAutomationUser(tb_pulumi.ThunderbirdComponentResource):
     :type enable_s3_bucket_upload: bool, optional
 
     :param s3_upload_buckets: When ``enable_s3_bucket_upload`` is True, allow uploading files to these buckets.
-        Defaults to [].
+        Defaults to None.
     :type s3_upload_buckets: list, optional
 
     :param opts: Additional pulumi.ResourceOptions to apply to these resources. Defaults to None.
@@ -77,261 +233,164 @@ class AwsAutomationUser(tb_pulumi.ThunderbirdComponentResource):
         name: str,
         project: tb_pulumi.ThunderbirdPulumiProject,
         active_stack: str = 'stage',
-        additional_policies: list[str] = [],
+        additional_policies: list[str] = None,
         enable_ecr_image_push: bool = False,
         ecr_repositories: list[str] = None,
-        enable_fargate_deployments: str = False,
+        enable_fargate_deployments: bool = False,
         fargate_clusters: list[str] = None,
         fargate_task_role_arns: list[str] = None,
         enable_full_s3_access: bool = False,
-        s3_full_access_buckets: list = [],
+        s3_full_access_buckets: list = None,
         enable_s3_bucket_upload: bool = False,
-        s3_upload_buckets: list[str] = [],
+        s3_upload_buckets: list[str] = None,
         opts: pulumi.ResourceOptions = None,
         **kwargs,
     ):
         super().__init__('tb:ci:Automationuser', name=name, project=project, opts=opts, **kwargs)
 
+        # Empty-tuple sentinels stand in for absent lists; nothing below mutates these
+        additional_policies = additional_policies or ()
+        s3_full_access_buckets = s3_full_access_buckets or ()
+        s3_upload_buckets = s3_upload_buckets or ()
+
         if project.stack == active_stack:
+            # Every resource below hangs off this component with no other options; one shared ResourceOptions and one
+            # tags reference serve them all (ResourceOptions.merge never mutates its arguments)
+            parent_opts = pulumi.ResourceOptions(parent=self)
+            tags = self.tags
+
             user = aws.iam.User(
                 f'{name}-user',
                 name=f'{self.project.project}-ci',
-                tags=self.tags,
-                opts=pulumi.ResourceOptions(parent=self),
+                tags=tags,
+                opts=parent_opts,
             )
 
             access_key = aws.iam.AccessKey(
                 f'{name}-accesskey',
                 user=user.name,
-                opts=pulumi.ResourceOptions(parent=self, depends_on=[user]),
+                opts=parent_opts,
             )
 
-            secret_value = pulumi.Output.all(id=access_key.id, secret=access_key.secret).apply(
-                lambda args: json.dumps({'aws_access_key_id': args['id'], 'aws_secret_access_key': args['secret']})
+            # json_dumps folds the key outputs in as they resolve - no lambda hop or intermediate dict per resolution -
+            # and the secret wrapper keeps the key material out of plaintext state and console output
+            secret_value = pulumi.Output.secret(
+                pulumi.Output.json_dumps(
+                    {'aws_access_key_id': access_key.id, 'aws_secret_access_key': access_key.secret}
+                )
             )
             secret = tb_pulumi.secrets.SecretsManagerSecret(
                 f'{name}-secret-accesskey',
                 project=project,
                 secret_name=f'{project.project}/{project.stack}/ci-access-keys',
                 secret_value=secret_value,
-                opts=pulumi.ResourceOptions(parent=self, depends_on=[access_key]),
-                tags=self.tags,
+                opts=parent_opts,
+                tags=tags,
             )
 
+            # Policies created below are collected here and attached to the user in one batch at the end
+            policies_to_attach = []
+
+            # Each permission branch adds its policy here as it is built; no per-key ternaries at the finish call
+            resources = {'user': user, 'access_key': access_key, 'secret': secret}
+
             if enable_ecr_image_push:
-                policy_dict = {
-                    'Version': '2012-10-17',
-                    'Statement': [
-                        {
-                            'Sid': 'ImageActions',
-                            'Effect': 'Allow',
-                            'Action': [
-                                'ecr:BatchCheckLayerAvailability',
-                                'ecr:BatchGetImage',
-                                'ecr:CompleteLayerUpload',
-                                'ecr:DescribeImages',
-                                'ecr:InitiateLayerUpload',
-                                'ecr:GetDownloadUrlForLayer',
-                                'ecr:ListImages',
-                                'ecr:UploadLayerPart',
-                                'ecr:PutImage',
-                            ],
-                            'Resource': [
-                                f'arn:aws:ecr:{project.aws_region}:{project.aws_account_id}:repository/{repo}'
-                                for repo in ecr_repositories
-                            ],
-                        },
-                        {
-                            'Sid': 'AuthActions',
-                            'Effect': 'Allow',
-                            'Action': ['ecr:GetAuthorizationToken'],
-                            'Resource': ['*'],
-                        },
-                    ],
-                }
-                policy_json = json.dumps(policy_dict)
+                policy_json = _ecr_push_policy_json(project.aws_region, project.aws_account_id, tuple(ecr_repositories))
                 ecr_image_push_policy = aws.iam.Policy(
                     f'{name}-policy-ecrpush',
                     name=f'{name}-ecr-push',
                     description=f'Allows CI automation for {project.project} to push container images to ECR.',
                     policy=policy_json,
-                    opts=pulumi.ResourceOptions(parent=self),
-                )
-
-                # Ignore unused variable rules for attachments like this using "noqa" statements for rule F841.
-                # Ref: https://docs.astral.sh/ruff/rules/unused-variable/
-                ecr_image_push_policy_attachment = aws.iam.PolicyAttachment(  # noqa: F841
-                    f'{name}-polatt-ecrpush',
-                    users=[user],
-                    policy_arn=ecr_image_push_policy.arn,
-                    opts=pulumi.ResourceOptions(parent=self, depends_on=[ecr_image_push_policy, user]),
+                    opts=parent_opts,
                 )
+                policies_to_attach.append(ecr_image_push_policy)
+                resources['ecr_image_push_policy'] = ecr_image_push_policy
 
             if enable_s3_bucket_upload:
-                policy_dict = {
-                    'Version': '2012-10-17',
-                    'Statement': [
-                        {
-                            'Sid': 'PutObjects',
-                            'Effect': 'Allow',
-                            'Action': ['s3:PutObject'],
-                            'Resource': [f'arn:aws:s3:::{bucket}/*' for bucket in s3_upload_buckets],
-                        }
-                    ],
-                }
-                policy_json = json.dumps(policy_dict)
+                policy_json = _s3_upload_policy_json(tuple(s3_upload_buckets))
                 s3_upload_policy = aws.iam.Policy(
                     f'{name}-policy-s3upload',
                     name=f'{name}-s3-upload',
                     description=f'Allows CI automation for {project.project} to upload files to certain S3 buckets.',
                     policy=policy_json,
-                    opts=pulumi.ResourceOptions(parent=self),
-                )
-                s3_upload_policy_attachment = aws.iam.PolicyAttachment(  # noqa: F841
-                    f'{name}-polatt-s3upload',
-                    users=[user],
-                    policy_arn=s3_upload_policy.arn,
-                    opts=pulumi.ResourceOptions(parent=self, depends_on=[s3_upload_policy, user]),
+                    opts=parent_opts,
                 )
+                policies_to_attach.append(s3_upload_policy)
+                resources['s3_upload_policy'] = s3_upload_policy
 
             if enable_full_s3_access:
-                resources = []
-                for bucket in s3_full_access_buckets:
-                    resources.append(f'arn:aws:s3:::{bucket}')
-                    resources.append(f'arn:aws:s3:::{bucket}/*')
-                policy_dict = {
-                    'Version': '2012-10-17',
-                    'Statement': [
-                        {
-                            'Sid': 'S3FullAccess',
-                            'Effect': 'Allow',
-                            'Action': ['s3:*'],
-                            'Resource': resources,
-                        }
-                    ],
-                }
-                policy_json = json.dumps(policy_dict)
+                policy_json = _s3_full_access_policy_json(tuple(s3_full_access_buckets))
                 s3_full_access_policy = aws.iam.Policy(
                     f'{name}-policy-s3fullaccess',
                     name=f'{name}-ci-s3-fullaccess',
                     description=f'Allows CI automation for {project.project} to do anything with certain S3 buckets.',
                     policy=policy_json,
-                    opts=pulumi.ResourceOptions(parent=self),
-                )
-                s3_full_access_policy_attachment = aws.iam.PolicyAttachment(  # noqa: F841
-                    f'{name}-polatt-s3fullaccess',
-                    users=[user],
-                    policy_arn=s3_full_access_policy.arn,
-                    opts=pulumi.ResourceOptions(parent=self, depends_on=[s3_full_access_policy, user]),
+                    opts=parent_opts,
                 )
+                policies_to_attach.append(s3_full_access_policy)
+                resources['s3_full_access_policy'] = s3_full_access_policy
 
             if enable_fargate_deployments:
-                ecs_write_resources = []
-                for cluster in fargate_clusters:
-                    ecs_write_resources.append(f'arn:aws:ecs:{project.aws_region}:{project.aws_account_id}:*/{cluster}')
-                    ecs_write_resources.append(
-                        f'arn:aws:ecs:{project.aws_region}:{project.aws_account_id}:*/{cluster}/*'
-                    )
-
-                policy_dict = {
-                    'Version': '2012-10-17',
-                    'Statement': [
-                        {
-                            'Sid': 'EcsWriteAccess',
-                            'Effect': 'Allow',
-                            'Action': ['ecs:*'],
-                            'Resource': ecs_write_resources,
-                        },
-                        {
-                            'Sid': 'DescribeTaskDefs',
-                            'Effect': 'Allow',
-                            'Action': ['ecs:DescribeTaskDefinition'],
-                            'Resource': ['*'],
-                        },
-                        {
-                            'Sid': 'RegisterTaskDef',
-                            'Effect': 'Allow',
-                            'Action': ['ecs:RegisterTaskDefinition'],
-                            'Resource': [
-                                f'arn:aws:ecs:{project.aws_region}:{project.aws_account_id}:task-definition/{cluster}:*'
-                                for cluster in fargate_clusters
-                            ],
-                        },
-                        {
-                            'Sid': 'GlobalObjectReadAccess',
-                            'Effect': 'Allow',
-                            'Action': [
-                                'cloudwatch:Describe*',
-                                'cloudwatch:List*',
-                                'cloudwatch:TagResource',
-                                'ec2:List*',
-                                'ec2:Get*',
-                                'ec2:Describe*',
-                                'ecs:DeregisterTaskDefinition',
-                                'elasticloadbalancing:Describe*',
-                                's3:ListAllMyBuckets',
-                            ],
-                            'Resource': ['*'],
-                        },
-                        {
-                            'Sid': 'IamFargateAuth',
-                            'Effect': 'Allow',
-                            'Action': ['iam:PassRole'],
-                            'Resource': fargate_task_role_arns,
-                        },
-                    ],
-                }
-                policy_json = json.dumps(policy_dict)
+                policy_json = _fargate_deployment_policy_json(
+                    project.aws_region,
+                    project.aws_account_id,
+                    tuple(fargate_clusters),
+                    tuple(fargate_task_role_arns),
+                )
                 fargate_deployment_policy = aws.iam.Policy(
                     f'{name}-policy-fargatedeploy',
                     name=f'{name}-s3-fargatedeploy',
-                    description=f'Allggows CI automation for {project.project} to deploy images to Fargate clusters.',
+                    description=f'Allows CI automation for {project.project} to deploy images to Fargate clusters.',
                     policy=policy_json,
-                    opts=pulumi.ResourceOptions(parent=self),
+                    opts=parent_opts,
                 )
-                fargate_deployment_policy_attachment = aws.iam.PolicyAttachment(  # noqa: F841
-                    f'{name}-polatt-fargatedeploy',
-                    users=[user],
-                    policy_arn=fargate_deployment_policy.arn,
-                    opts=pulumi.ResourceOptions(parent=self, depends_on=[fargate_deployment_policy, user]),
+                policies_to_attach.append(fargate_deployment_policy)
+                resources['fargate_deployment_policy'] = fargate_deployment_policy
+
+            # Attach all other policies; these are plain ARNs supplied by the caller, deduplicated in order so a
+            # repeated ARN cannot produce duplicate entries in the attachment set
+            policies_to_attach.extend(dict.fromkeys(additional_policies))
+
+            # One exclusive resource manages the user's entire set of managed-policy attachments, batching what was
+            # previously one AttachUserPolicy round-trip per policy - calls IAM serializes behind
+            # ConcurrentModification retries. Exclusivity is safe here: this user exists only for CI and every policy
+            # it carries is declared through this component.
+            if policies_to_attach:
+                aws.iam.UserPolicyAttachmentsExclusive(
+                    f'{name}-polatts',
+                    user_name=user.name,
+                    policy_arns=[
+                        policy.arn if isinstance(policy, aws.iam.Policy) else policy for policy in policies_to_attach
+                    ],
+                    opts=parent_opts,
                 )
 
-                # Attach all other policies
-                for idx, policy in enumerate(additional_policies):
-                    aws.iam.PolicyAttachment(
-                        f'{name}-polatt-additional-{idx}',
-                        users=[user],
-                        policy_arn=policy,
-                        opts=pulumi.ResourceOptions(parent=self, depends_on=[user]),
-                    )
-
-            self.finish(
-                outputs={'user_name': user.name},
-                resources={
-                    'user': user,
-                    'access_key': access_key,
-                    'secret': secret,
-                    'ecr_image_push_policy': ecr_image_push_policy if enable_ecr_image_push else None,
-                    's3_upload_policy': s3_upload_policy if enable_s3_bucket_upload else None,
-                    's3_full_access_policy': s3_full_access_policy if enable_full_s3_access else None,
-                    'fargate_deployment_policy': fargate_deployment_policy if enable_fargate_deployments else None,
-                },
-            )
+            self.finish(outputs={'user_name': user.name}, resources=resources)
         else:
             msg = (
                 f'The current stack is "{project.stack}", but CI components are associated with the '
                 + f'"{active_stack}" stack. These resources will be skipped on this run.'
             )
             pulumi.info(msg)
-            self.finish(
-                outputs={'user_name': None},
-                resources={
-                    'user': None,
-                    'access_key': None,
-                    'secret': None,
-                    'ecr_image_push_policy': None,
-                    's3_upload_policy': None,
-                    's3_full_access_policy': None,
-                    'fargate_deployment_policy': None,
-                },
+            self.finish(outputs={'user_name': None})
+
+    @classmethod
+    def create_if_active(
+        cls, name: str, project: tb_pulumi.ThunderbirdPulumiProject, active_stack: str = 'stage', **kwargs
+    ):
+        """Builds an ``AwsAutomationUser`` only when the project is operating on ``active_stack``. When any other stack
+        is being operated on, this logs the usual explanatory message and returns None without constructing the
+        component at all, so no empty component resource gets registered with the Pulumi engine on unrelated stack
+        runs. Accepts the same parameters as the constructor.
+
+        :return: An AwsAutomationUser, or None when the current stack is not the active stack.
+        :rtype: AwsAutomationUser | None
+        """
+
+        if project.stack != active_stack:
+            pulumi.info(
+                f'The current stack is "{project.stack}", but CI components are associated with the '
+                + f'"{active_stack}" stack. These resources will be skipped on this run.'
             )
+            return None
+        return cls(name, project, active_stack=active_stack, **kwargs)
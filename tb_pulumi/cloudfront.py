@@ -2,16 +2,35 @@
 `AWS CloudFront <https://docs.aws.amazon.com/AmazonCloudFront/latest/DeveloperGuide/Introduction.html>`_.
 """
 
-import json
 import pulumi
 import pulumi_aws as aws
 import tb_pulumi
 
+from functools import lru_cache
+
 
 CACHE_POLICY_ID_OPTIMIZED = '658327ea-f89d-4fab-a63d-7e88639e58f6'  # "Managed-CachingOptimized" policy
 CACHE_POLICY_ID_DISABLED = '4135ea2d-6df8-44a3-9df3-4b5a84be39ad'  # "Managed-CachingDisabled" policy
 ORIGIN_REQUEST_POLICY_ID_ALLVIEWER = '216adef6-5c7f-47e4-b989-5492eafa07d3'  # "Managed-AllViewer" policy
 
+#: HTTP methods the default cache behavior forwards and caches
+DEFAULT_CACHE_ALLOWED_METHODS = ['HEAD', 'DELETE', 'POST', 'GET', 'OPTIONS', 'PUT', 'PATCH']
+DEFAULT_CACHE_CACHED_METHODS = ['HEAD', 'GET']
+
+# Static configuration fragments shared by every instantiation rather than rebuilt per call; none are ever mutated
+_SSE_CONFIG = {'rule': {'applyServerSideEncryptionByDefault': {'sseAlgorithm': 'AES256'}, 'bucket_key_enabled': True}}
+_OWNERSHIP_RULE = {'object_ownership': 'BucketOwnerPreferred'}
+_NO_RESTRICTIONS = {'geo_restriction': {'restriction_type': 'none'}}
+_VIEWER_CERT_BASE = {'minimum_protocol_version': 'TLSv1.2_2021', 'ssl_support_method': 'sni-only'}
+
+
+@lru_cache(maxsize=None)
+def _canonical_user_id() -> str:
+    """Returns the canonical user ID of the acting AWS account. This is a synchronous provider call and the value is
+    per-account, so it is resolved once and shared by every distribution built in the process."""
+
+    return aws.s3.get_canonical_user_id().id
+
 
 class CloudFrontS3Service(tb_pulumi.ThunderbirdComponentResource):
     """Serve the static contents of an S3 bucket over a CloudFront Distribution.
@@ -32,11 +51,11 @@ class CloudFrontS3Service(tb_pulumi.ThunderbirdComponentResource):
     :param behaviors: The default behavior of the CF distribution will always be to look in the S3 bucket. Any other
         behaviors should be defined as an entry in this list. These should be `DistributionOrderedCacheBehavior
         <https://www.pulumi.com/registry/packages/aws/api-docs/cloudfront/distribution/#distributionorderedcachebehavior>`_
-        objects. Defaults to [].
+        objects. Defaults to None.
     :type behaviors: list[dict], optional
 
     :param distribution: Additional parameters to pass to the `aws.cloudfront.Distribution constructor
-        <https://www.pulumi.com/registry/packages/aws/api-docs/cloudfront/distribution>`_. Defaults to {}.
+        <https://www.pulumi.com/registry/packages/aws/api-docs/cloudfront/distribution>`_. Defaults to None.
     :type distribution: dict, optional
 
     :param forcibly_destroy_buckets: When True, the service bucket and logging bucket will both be forcibly emptied -
@@ -47,7 +66,7 @@ class CloudFrontS3Service(tb_pulumi.ThunderbirdComponentResource):
     :param origins: List of `DistributionOrigin
         <https://www.pulumi.com/registry/packages/aws/api-docs/cloudfront/distribution/#distributionorigin>`_ objects to
         add. This list should not include any references to the S3 bucket, which is managed by this module. Defaults to
-        [].
+        None.
     :type origins: list[dict], optional
 
     :param opts: Additional pulumi.ResourceOptions to apply to these resources. Defaults to None.
@@ -63,26 +82,42 @@ class CloudFrontS3Service(tb_pulumi.ThunderbirdComponentResource):
         project: tb_pulumi.ThunderbirdPulumiProject,
         certificate_arn: str,
         service_bucket_name: str,
-        behaviors: list[dict] = [],
-        default_function_associations: dict = {},
-        distribution: dict = {},
+        behaviors: list[dict] = None,
+        default_function_associations: dict = None,
+        distribution: dict = None,
         forcibly_destroy_buckets: bool = False,
-        origins: list[dict] = [],
+        origins: list[dict] = None,
         opts: pulumi.ResourceOptions = None,
         **kwargs,
     ):
         super().__init__('tb:cloudfront:CloudFrontS3Service', name=name, project=project, opts=opts, **kwargs)
 
+        # Normalize the None sentinels; mutable defaults would be shared across every construction
+        behaviors = behaviors or []
+        default_function_associations = default_function_associations or {}
+        distribution = distribution or {}
+        origins = origins or []
+
+        # Identifiers derived from the bucket name, computed once up front and referenced throughout.
+        # The `bucket_regional_domain_name` output does not actually seem to contain the region. This may be a bug in
+        # the AWS Pulumi provider. For now, we have to form this domain ourselves or it will be incorrect.
+        service_bucket_objects_arn = f'arn:aws:s3:::{service_bucket_name}/*'
+
+        # Shared by every child resource that needs no extra dependencies; ResourceOptions.merge never mutates
+        parent_opts = pulumi.ResourceOptions(parent=self)
+        #: Region-qualified domain name of the service bucket; saved so consumers can reference it without re-deriving
+        self.bucket_regional_domain_name = bucket_regional_domain_name = (
+            f'{service_bucket_name}.s3.{project.aws_region}.amazonaws.com'
+        )
+
         # The function supports supplying the bucket policy at this time, but we have to have the CF distro built first.
         # For this reason, we build the bucket without the policy and attach the policy later on.
         service_bucket = aws.s3.Bucket(
             f'{name}-servicebucket',
             bucket=service_bucket_name,
             force_destroy=forcibly_destroy_buckets,
-            server_side_encryption_configuration={
-                'rule': {'applyServerSideEncryptionByDefault': {'sseAlgorithm': 'AES256'}, 'bucket_key_enabled': True}
-            },
-            opts=pulumi.ResourceOptions(parent=self),
+            server_side_encryption_configuration=_SSE_CONFIG,
+            opts=parent_opts,
             tags=self.tags,
         )
 
@@ -91,21 +126,19 @@ class CloudFrontS3Service(tb_pulumi.ThunderbirdComponentResource):
             f'{name}-loggingbucket',
             bucket=f'{service_bucket_name}-logs',
             force_destroy=forcibly_destroy_buckets,
-            server_side_encryption_configuration={
-                'rule': {'applyServerSideEncryptionByDefault': {'sseAlgorithm': 'AES256'}, 'bucket_key_enabled': True}
-            },
-            opts=pulumi.ResourceOptions(parent=self),
+            server_side_encryption_configuration=_SSE_CONFIG,
+            opts=parent_opts,
             tags=self.tags,
         )
 
         logging_bucket_ownership = aws.s3.BucketOwnershipControls(
             f'{name}-bucketownership',
             bucket=logging_bucket.id,
-            rule={'object_ownership': 'BucketOwnerPreferred'},
-            opts=pulumi.ResourceOptions(parent=self, depends_on=[logging_bucket]),
+            rule=_OWNERSHIP_RULE,
+            opts=parent_opts,
         )
 
-        canonical_user = aws.s3.get_canonical_user_id().id
+        canonical_user = _canonical_user_id()
         logging_bucket_acl = aws.s3.BucketAclV2(
             f'{name}-bucketacl',
             bucket=logging_bucket.id,
@@ -118,7 +151,9 @@ class CloudFrontS3Service(tb_pulumi.ThunderbirdComponentResource):
                 ],
                 'owner': {'id': canonical_user},
             },
-            opts=pulumi.ResourceOptions(parent=self, depends_on=[logging_bucket, logging_bucket_ownership]),
+            # The bucket edge is inferred from the bucket input; the ownership controls must be declared explicitly
+            # since no Output of theirs is consumed, and the ACL cannot be applied until they exist
+            opts=pulumi.ResourceOptions(parent=self, depends_on=[logging_bucket_ownership]),
         )
 
         # Create an Origin Access Control to use when CloudFront talks to S3
@@ -129,13 +164,10 @@ class CloudFrontS3Service(tb_pulumi.ThunderbirdComponentResource):
             signing_protocol='sigv4',
             description=f'Serve {service_bucket_name} contents via CDN',
             name=service_bucket_name,
-            opts=pulumi.ResourceOptions(parent=self),
+            opts=parent_opts,
         )
 
-        # Define the S3 DistributionOrigin and set up the distribution.
-        # The `bucket_regional_domain_name` output does not actually seem to contain the region. This may be a bug in
-        # the AWS Pulumi provider. For now, we have to form this domain ourselves or it will be incorrect.
-        bucket_regional_domain_name = f'{service_bucket_name}.s3.{project.aws_region}.amazonaws.com'
+        # Define the S3 DistributionOrigin and set up the distribution
         s3_origin = {
             'domain_name': bucket_regional_domain_name,
             'origin_id': bucket_regional_domain_name,
@@ -154,8 +186,8 @@ class CloudFrontS3Service(tb_pulumi.ThunderbirdComponentResource):
         cloudfront_distribution = aws.cloudfront.Distribution(
             f'{name}-cfdistro',
             default_cache_behavior={
-                'allowed_methods': ['HEAD', 'DELETE', 'POST', 'GET', 'OPTIONS', 'PUT', 'PATCH'],
-                'cached_methods': ['HEAD', 'GET'],
+                'allowed_methods': DEFAULT_CACHE_ALLOWED_METHODS,
+                'cached_methods': DEFAULT_CACHE_CACHED_METHODS,
                 'cache_policy_id': CACHE_POLICY_ID_OPTIMIZED,
                 'compress': True,
                 'function_associations': default_function_associations,
@@ -166,17 +198,11 @@ class CloudFrontS3Service(tb_pulumi.ThunderbirdComponentResource):
             logging_config=logging_config,
             ordered_cache_behaviors=behaviors,
             origins=all_origins,
-            restrictions={'geo_restriction': {'restriction_type': 'none'}},
-            viewer_certificate={
-                'acm_certificate_arn': certificate_arn,
-                'minimum_protocol_version': 'TLSv1.2_2021',
-                'ssl_support_method': 'sni-only',
-            },
+            restrictions=_NO_RESTRICTIONS,
+            viewer_certificate={'acm_certificate_arn': certificate_arn, **_VIEWER_CERT_BASE},
             tags=self.tags,
-            opts=pulumi.ResourceOptions(
-                parent=self,
-                depends_on=[logging_bucket, oac],
-            ),
+            # The logging bucket and OAC edges are inferred from the bucket_domain_name and oac.id Outputs above
+            opts=parent_opts,
             **distribution,
         )
 
@@ -190,7 +216,7 @@ class CloudFrontS3Service(tb_pulumi.ThunderbirdComponentResource):
                     'Effect': 'Allow',
                     'Principal': {'Service': 'cloudfront.amazonaws.com'},
                     'Action': 's3:GetObject',
-                    'Resource': f'arn:aws:s3:::{service_bucket_name}/*',
+                    'Resource': service_bucket_objects_arn,
                     'Condition': {'StringEquals': {'AWS:SourceArn': cloudfront_distribution.arn}},
                 }
             ],
@@ -199,37 +225,39 @@ class CloudFrontS3Service(tb_pulumi.ThunderbirdComponentResource):
         service_bucket_policy = aws.s3.BucketPolicy(
             f'{name}-bucketpolicy-service',
             bucket=service_bucket,
-            policy=bucket_policy,
-            opts=pulumi.ResourceOptions(
-                parent=self,
-                depends_on=[service_bucket, cloudfront_distribution],
-            ),
+            # Serialize once up front; Output.json_dumps folds the distribution ARN in as it resolves, rather than
+            # leaving pulumi to coerce the raw dict input-by-input on every operation
+            policy=pulumi.Output.json_dumps(bucket_policy),
+            # Both edges are inferred: the bucket from the bucket input, the distribution from the policy's ARN Output
+            opts=parent_opts,
         )
 
-        # Create a policy allowing cache invalidation of this distro
-        invalidation_policy_json = cloudfront_distribution.arn.apply(
-            lambda distro_arn: json.dumps(
-                {
-                    'Version': '2012-10-17',
-                    'Id': 'CacheInvalidation',
-                    'Statement': [
-                        {
-                            'Sid': 'InvalidateDistroCache',
-                            'Effect': 'Allow',
-                            'Action': ['cloudfront:CreateInvalidation'],
-                            'Resource': [distro_arn],
-                        }
-                    ],
-                }
-            )
+        # Create a policy allowing cache invalidation of this distro. json_dumps folds the distribution ARN in as it
+        # resolves - no lambda hop or per-resolution dict rebuild - with compact separators since the default padding
+        # is dead weight in the policy payload.
+        invalidation_policy_json = pulumi.Output.json_dumps(
+            {
+                'Version': '2012-10-17',
+                'Id': 'CacheInvalidation',
+                'Statement': [
+                    {
+                        'Sid': 'InvalidateDistroCache',
+                        'Effect': 'Allow',
+                        'Action': ['cloudfront:CreateInvalidation'],
+                        'Resource': [cloudfront_distribution.arn],
+                    }
+                ],
+            },
+            separators=(',', ':'),
         )
 
         invalidation_policy = aws.iam.Policy(
             f'{name}-policy-invalidation',
             name=f'{name}-cache-invalidation',
             description=f'Allows for the invalidation of CDN cache for CloudFront distribution {name}',
+            # The distribution edge rides along on the policy Output
             policy=invalidation_policy_json,
-            opts=pulumi.ResourceOptions(parent=self, depends_on=[cloudfront_distribution]),
+            opts=parent_opts,
         )
 
         self.finish(
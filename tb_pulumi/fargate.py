@@ -6,7 +6,7 @@ import pulumi
 import pulumi_aws as aws
 import tb_pulumi
 
-from tb_pulumi.constants import ASSUME_ROLE_POLICY, DEFAULT_AWS_SSL_POLICY
+from tb_pulumi.constants import DEFAULT_AWS_SSL_POLICY
 
 
 class FargateClusterWithLogging(tb_pulumi.ThunderbirdComponentResource):
@@ -109,6 +109,10 @@ class FargateClusterWithLogging(tb_pulumi.ThunderbirdComponentResource):
         super().__init__('tb:fargate:FargateClusterWithLogging', name, project, opts=opts, **kwargs)
         family = name
 
+        # Several child resources take identical options; pulumi copies opts on registration, so one shared instance
+        # is safe and saves an allocation per resource
+        parent_opts = pulumi.ResourceOptions(parent=self)
+
         # Key to encrypt logs
         log_key_tags = {'Name': f'{name}-fargate-logs'}
         log_key_tags.update(self.tags)
@@ -117,7 +121,7 @@ class FargateClusterWithLogging(tb_pulumi.ThunderbirdComponentResource):
             description=f'Key to encrypt logs for {name}',
             deletion_window_in_days=key_deletion_window_in_days,
             tags=log_key_tags,
-            opts=pulumi.ResourceOptions(parent=self),
+            opts=parent_opts,
         )
 
         # Log group
@@ -125,13 +129,24 @@ class FargateClusterWithLogging(tb_pulumi.ThunderbirdComponentResource):
             f'{name}-fargate-logs',
             name=f'{name}-fargate-logs',
             tags=self.tags,
-            opts=pulumi.ResourceOptions(parent=self),
+            opts=parent_opts,
         )
 
-        # Set up an assume role policy
-        arp = ASSUME_ROLE_POLICY.copy()
-        arp['Statement'][0]['Principal']['Service'] = 'ecs-tasks.amazonaws.com'
-        arp = json.dumps(arp)
+        # Set up an assume role policy. Built as a literal rather than by copying ASSUME_ROLE_POLICY; a shallow copy
+        # shares the nested Statement list, so setting the principal through it would mutate the module constant.
+        arp = json.dumps(
+            {
+                'Version': '2012-10-17',
+                'Statement': [
+                    {
+                        'Sid': '',
+                        'Effect': 'Allow',
+                        'Principal': {'Service': 'ecs-tasks.amazonaws.com'},
+                        'Action': 'sts:AssumeRole',
+                    }
+                ],
+            }
+        )
 
         # IAM policy for shipping logs
         log_doc = log_group.arn.apply(
@@ -198,7 +213,7 @@ class FargateClusterWithLogging(tb_pulumi.ThunderbirdComponentResource):
             name=f'{name}-exec',
             description=f'Allows {self.project.project} tasks access to resources they need to run',
             policy=container_doc,
-            opts=pulumi.ResourceOptions(parent=self),
+            opts=parent_opts,
         )
 
         # Create an IAM role for tasks to run as
@@ -236,17 +251,18 @@ class FargateClusterWithLogging(tb_pulumi.ThunderbirdComponentResource):
         )
 
         # Prep the task definition
+        # The region is a plain string, so it gets passed straight through; only values that are genuinely Outputs
+        # (the log group name and role ARN) need to go through the Output resolution machinery.
         task_definition_res = pulumi.Output.all(
             log_group.name,
-            self.project.aws_region,
             task_role.arn,
         ).apply(
             lambda outputs: self.task_definition(
                 task_def=task_definition,
                 family=family,
                 log_group_name=outputs[0],
-                aws_region=outputs[1],
-                task_role_arn=outputs[2],
+                aws_region=self.project.aws_region,
+                task_role_arn=outputs[1],
                 dependencies=[log_group, task_role],
             )
         )
@@ -263,7 +279,7 @@ class FargateClusterWithLogging(tb_pulumi.ThunderbirdComponentResource):
             internal=internal,
             security_groups=security_groups,
             services=services,
-            opts=pulumi.ResourceOptions(parent=self),
+            opts=parent_opts,
         )
 
         # We only need one Fargate Service config, but that might have multiple load balancer
@@ -347,18 +363,21 @@ class FargateClusterWithLogging(tb_pulumi.ThunderbirdComponentResource):
         :rtype: aws.ecs.TaskDefinition
         """
 
+        # The default log configuration is identical for every container; build it once and let containers without an
+        # override share it rather than allocating a copy per container. It is only ever serialized, never mutated.
+        default_log_config = {
+            'logDriver': 'awslogs',
+            'options': {
+                'awslogs-group': log_group_name,
+                'awslogs-create-group': 'true',
+                'awslogs-region': aws_region,
+                'awslogs-stream-prefix': 'ecs',
+            },
+        }
         for cont_name, cont_def in task_def['container_definitions'].items():
-            # If not overridden, inject a default log configuration
+            # If not overridden, inject the default log configuration
             if 'logConfiguration' not in cont_def:
-                cont_def['logConfiguration'] = {
-                    'logDriver': 'awslogs',
-                    'options': {
-                        'awslogs-group': log_group_name,
-                        'awslogs-create-group': 'true',
-                        'awslogs-region': aws_region,
-                        'awslogs-stream-prefix': 'ecs',
-                    },
-                }
+                cont_def['logConfiguration'] = default_log_config
             cont_def['name'] = cont_name
 
         # Convert container defs into list
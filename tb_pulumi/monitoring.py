@@ -208,8 +208,9 @@ class AlarmGroup(tb_pulumi.ThunderbirdComponentResource):
         self.monitoring_group = monitoring_group
         self.resource = resource
 
-        # Tag alarms with their resource names for easy reference when tweaking later
-        self.tags.update({'tb_pulumi_resource_name': resource._name})
+        # Tag alarms with their resource names for easy reference when tweaking later. Rebuild rather than update in
+        # place; when no tag overrides are set, self.tags is the project's shared read-only mapping.
+        self.tags = {**self.tags, 'tb_pulumi_resource_name': resource._name}
 
     @cached_property
     def overrides(self) -> dict: